@@ -6,16 +6,34 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, KeysView
+from functools import lru_cache
 from html import unescape
 from importlib import import_module
-from logging import Logger, getLogger
+from itertools import groupby
+from logging import DEBUG, Logger, getLogger
+from operator import itemgetter
 from types import ModuleType
 from typing import Any
 from urllib.parse import quote_plus
 
-from requests import HTTPError, RequestException, Response, request
+from requests import HTTPError, RequestException, Response, Session
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+try:
+    # orjson parses and serializes JSON several times faster than the
+    # stdlib, which matters for zones with many ResourceRecordSets.
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    # httpx is only needed for the optional HTTP/2 transport.
+    import httpx as _httpx
+except ImportError:
+    _httpx = None
+
 from octodns.provider import ProviderException
 from octodns.provider.base import BaseProvider
 from octodns.provider.plan import Plan
@@ -26,15 +44,49 @@ from octodns.zone import Zone
 __version__ = __VERSION__ = '0.0.1'
 
 
-def _add_trailing_dot(value: str) -> str:
-    if len(value) > 0 and value[-1] != '.':
-        value = f'{value}.'
+def _xform_chunked(value: str) -> str:
+    # Revert escaped semicolons in _ChunkedValue.
+    if '\\;' in value:
+        return value.replace('\\;', ';')
     return value
 
 
+@lru_cache(maxsize=256)
+def _xform_caa(value: str) -> str:
+    # The same CAA value commonly repeats across subdomains; memoize the
+    # parse + format per unique rdata.
+    v: dict[str, Any] = CaaValue.parse_rdata_text(value)
+    return f'{v["flags"]} {v["tag"]} "{v["value"]}"'
+
+
+# Per-value RData transforms keyed by record type; types absent from the
+# map pass their values through unchanged.
+_VALUE_XFORMS: dict[str, Callable[[str], str]] = {
+    "TXT": _xform_chunked,
+    "HTTPS": _xform_chunked,
+    "SVCB": _xform_chunked,
+    "CAA": _xform_caa,
+}
+
+# The query string is similar to the flow-style YAML. Filtering on the
+# provider class server-side keeps non-DNS CommonServiceItems out of the
+# response payload.
+#   {Filter: {"Provider.Class": "dns"}, Count: 0}
+_LIST_PATH: str = (
+    '/commonserviceitem?'
+    f"""{quote_plus('{Filter: {"Provider.Class": "dns"}, Count: 0}')}"""
+)
+
+
+def _add_trailing_dot(value: str) -> str:
+    if not value or value.endswith('.'):
+        return value
+    return f'{value}.'
+
+
 def _remove_trailing_dot(value: str) -> str:
-    if len(value) > 0 and value[-1] == '.':
-        value = value[:-1]
+    if value.endswith('.'):
+        return value[:-1]
     return value
 
 
@@ -48,6 +100,7 @@ class SakuraCloudAPI:
         endpoint: str,
         timeout: int,
         log: Logger,
+        http2: bool = False,
     ) -> None:
         """Create a SakuraCloudAPI object.
 
@@ -61,6 +114,8 @@ class SakuraCloudAPI:
         :type  timeout: int
         :param log: request timeout
         :type  log: logging.Logger
+        :param http2: use an HTTP/2 client; requires the httpx package
+        :type  http2: bool
         """
         self._auth = HTTPBasicAuth(access_token, access_token_secret)
         self._endpoint: str = endpoint
@@ -68,8 +123,44 @@ class SakuraCloudAPI:
         self._common_service_item_map = None
         self.log: Logger = log
 
+        # Reuse a single session so that back-to-back API calls keep the
+        # TCP+TLS connection alive instead of paying the handshake each time.
+        self._session: Session = Session()
+        self._session.auth = self._auth
+        self._session.headers.update(
+            {"Content-Type": "application/json; charset=UTF-8"}
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        )
+
+        # Optional HTTP/2 client; multiplexes concurrent requests on a
+        # single TLS connection.
+        self._client = None
+        if http2:
+            if _httpx is None:
+                raise SakuraCloudException(
+                    "http2=True requires the httpx package"
+                )
+            self._client = _httpx.Client(
+                http2=True,
+                auth=(access_token, access_token_secret),
+                timeout=timeout,
+                limits=_httpx.Limits(max_connections=16),
+                headers={"Content-Type": "application/json; charset=UTF-8"},
+            )
+
+    def __del__(self) -> None:
+        self._session.close()
+        if self._client is not None:
+            self._client.close()
+
     def _request(
-        self, method: str, path: str, json: dict[str, dict[str, Any]] = None
+        self,
+        method: str,
+        path: str,
+        json: dict[str, dict[str, Any]] = None,
+        stream: bool = False,
     ) -> dict[str, Any]:
         """Wrapper method for `requests.request()`.
 
@@ -81,24 +172,30 @@ class SakuraCloudAPI:
         :param json: (optional) A JSON serializable Python object to send in
             the body of the :class:`Request`.
         :type  json: dict
+        :param stream: (optional) If True, read the body from the raw
+            socket instead of buffering it through requests' content
+            path. Useful for large listing responses.
+        :type  stream: bool
         :return: Dictionary that decodes the JSON response body.
         :rtype: dict
         """
         self.log.debug('_request: method=%s, path=%s', method, path)
 
-        headers: dict[str, str] = {}
-        if json is not None:
-            headers["Content-Type"] = "application/json; charset=UTF-8"
-
         url: str = f"{self._endpoint}{path}"
+        data: bytes | str | None = (
+            _json.dumps(json) if json is not None else None
+        )
+
+        if self._client is not None:
+            return self._request_http2(method, url, data)
+
         try:
-            resp: Response = request(
+            resp: Response = self._session.request(
                 method=method,
                 url=url,
-                json=json,
-                headers=headers,
-                auth=self._auth,
+                data=data,
                 timeout=self._timeout,
+                stream=stream,
             )
             self.log.debug('_request:   status=%d', resp.status_code)
         except RequestException as e:
@@ -117,15 +214,53 @@ class SakuraCloudAPI:
         #   }
         try:
             resp.raise_for_status()
+            if stream:
+                return _json.loads(resp.raw.read(decode_content=True))
+            return _json.loads(resp.content)
         except HTTPError as e:
-            err: dict[str, Any] = e.response.json()
+            err: dict[str, Any] = _json.loads(e.response.content)
+            raise SakuraCloudException(
+                f"HTTP error: method={method}, url={url}, "
+                f"status={err['status']}, serial={err['serial']}, "
+                f"error_code={err['error_code']}, "
+                f"error_msg={unescape(err['error_msg'])}"
+            ) from e
+        finally:
+            resp.close()
+
+    def _request_http2(
+        self, method: str, url: str, data: bytes | str | None
+    ) -> dict[str, Any]:
+        """Sends a request over the HTTP/2 client.
+
+        :param method: method for the request: ``GET``, ``POST``, ``PUT``.
+        :type  method: str
+        :param url: URL for the request.
+        :type  url: str
+        :param data: (optional) The serialized request body.
+        :type  data: bytes
+        :return: Dictionary that decodes the JSON response body.
+        :rtype: dict
+        """
+        try:
+            resp = self._client.request(method, url, content=data)
+            self.log.debug('_request:   status=%d', resp.status_code)
+        except _httpx.HTTPError as e:
+            raise SakuraCloudException(
+                f"Request error: method={method}, url={url}: {e}"
+            ) from e
+
+        try:
+            resp.raise_for_status()
+        except _httpx.HTTPStatusError as e:
+            err: dict[str, Any] = _json.loads(e.response.content)
             raise SakuraCloudException(
                 f"HTTP error: method={method}, url={url}, "
                 f"status={err['status']}, serial={err['serial']}, "
                 f"error_code={err['error_code']}, "
                 f"error_msg={unescape(err['error_msg'])}"
             ) from e
-        return resp.json()
+        return _json.loads(resp.content)
 
     def _get_common_service_items(self) -> list[dict[str, Any]]:
         """Gets all the zones in the account.
@@ -183,11 +318,9 @@ class SakuraCloudAPI:
         #   "is_ok": true
         # }
 
-        # The query string is similar to the flow-style YAML.
-        #   {Count: 0}
-        query: str = quote_plus("{Count: 0}")
-        path = f"/commonserviceitem?{query}"
-        resp_data: dict[str, Any] = self._request("GET", path)
+        resp_data: dict[str, Any] = self._request(
+            "GET", _LIST_PATH, stream=True
+        )
         common_service_items: list[dict[str, Any]] = resp_data[
             "CommonServiceItems"
         ]
@@ -224,13 +357,23 @@ class SakuraCloudAPI:
         """
         return self._get_common_service_item_map().get(zone_name)
 
-    def get_zone_names(self) -> list[str]:
-        """Returns a list of zone names.
+    def has_zone(self, zone_name: str) -> bool:
+        """Returns whether the zone exists in the account.
 
-        :return: list of CommonServiceItem.
-        :rtype: list
+        :param zone_name: A zone name.
+        :type  zone_name: str
+        :return: True if the zone exists.
+        :rtype: bool
         """
-        return list(self._get_common_service_item_map().keys())
+        return zone_name in self._get_common_service_item_map()
+
+    def get_zone_names(self) -> KeysView[str]:
+        """Returns a view of zone names.
+
+        :return: View of zone names.
+        :rtype: collections.abc.KeysView
+        """
+        return self._get_common_service_item_map().keys()
 
     def _post_common_service_item(
         self, data: dict[str, dict[str, Any]]
@@ -315,6 +458,9 @@ class SakuraCloudAPI:
         :return: CommonServiceItem.
         :rtype: dict
         """
+        # Make sure the map is populated before inserting the new zone.
+        item_map: dict[str, Any] = self._get_common_service_item_map()
+
         name: str = _remove_trailing_dot(zone_name)
         req_item: dict[str, dict[str, Any]] = {
             "CommonServiceItem": {
@@ -329,7 +475,7 @@ class SakuraCloudAPI:
             req_item
         )
         item: dict[str, Any] = resp_data["CommonServiceItem"]
-        self._get_common_service_item_map()[zone_name] = item
+        item_map[zone_name] = item
 
     def _put_common_service_item(
         self, item_id: str, data: dict[str, dict[str, Any]]
@@ -431,7 +577,9 @@ class SakuraCloudAPI:
             self._common_service_item_map[zone_name]['ID'], req_data
         )
         item: dict[str, Any] = resp_data["CommonServiceItem"]
-        self._get_common_service_item_map()[zone_name] = item
+        # The map is already populated here; update_zone read the item ID
+        # from it above.
+        self._common_service_item_map[zone_name] = item
 
 
 class SakuraCloudException(ProviderException):
@@ -467,6 +615,10 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
       #
       # DNS service is independent of zones, so you can use any of these
       # endpoints. The default is the Ishikari first Zone.
+      #
+      # Use HTTP/2 for API calls (optional, default false). Requires the
+      # httpx package.
+      http2: false
     ```
 
     Example config file with variables:
@@ -511,6 +663,26 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
         )
     )
 
+    _RECORD_CLASSES: dict[str, type[Record]] | None = None
+
+    @classmethod
+    def _record_classes(cls) -> dict[str, type[Record]]:
+        """Returns a map of record type to octodns Record class.
+
+        The map is resolved once per process so that populate() does not
+        repeat the module attribute lookups for every rrset.
+
+        :return: Dictionary of record type and Record class.
+        :rtype: dict
+        """
+        if cls._RECORD_CLASSES is None:
+            module: ModuleType = import_module("octodns.record")
+            cls._RECORD_CLASSES = {
+                _type: getattr(module, f'{_type.title()}Record')
+                for _type in cls.SUPPORTS
+            }
+        return cls._RECORD_CLASSES
+
     TIMEOUT = 60
     DEFAULT_ENDPOINT = (
         "https://secure.sakura.ad.jp/cloud/zone/is1a/api/cloud/1.1"
@@ -524,6 +696,7 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
         access_token_secret: str,
         endpoint: str = DEFAULT_ENDPOINT,
         timeout: int = TIMEOUT,
+        http2: bool = False,
         *args,
         **kwargs,
     ) -> None:
@@ -539,6 +712,8 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
         :type  endpoint: str
         :param timeout: Request timeout.
         :type  timeout: int
+        :param http2: Use HTTP/2 for API calls; requires the httpx package.
+        :type  http2: bool
         """
         self.log: Logger = getLogger(f'SakuraCloudProvider[{id}]')
         self.log.debug('__init__: id=%s', id)
@@ -549,7 +724,9 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
             endpoint=endpoint,
             timeout=timeout,
             log=self.log,
+            http2=http2,
         )
+        self._zone_names_sorted: list[str] | None = None
         super().__init__(id, *args, **kwargs)
 
     def list_zones(self) -> list[str]:
@@ -561,7 +738,9 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
         :rtype: list
         """
         self.log.debug('list_zones:')
-        return sorted(self.api.get_zone_names())
+        if self._zone_names_sorted is None:
+            self._zone_names_sorted = sorted(self.api.get_zone_names())
+        return self._zone_names_sorted
 
     def populate(
         self, zone, target: bool = False, lenient: bool = False
@@ -597,41 +776,48 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
             return False
         exists = True
 
-        rrset_map: dict[str, dict[str, Any]] = {}
-        for rr in item["Settings"]["DNS"]["ResourceRecordSets"]:
-            _type: str = rr["Type"]
-            if _type not in self.SUPPORTS:
-                continue
-            key: str = rr["Name"] + '\0' + rr["Type"]
-            if key not in rrset_map:
-                record_name: str = rr["Name"]
-                if record_name == "@":
-                    record_name = ""
-                rrset_map[key] = {
-                    "name": record_name,
-                    "type": rr["Type"],
-                    "rdatas": [rr["RData"]],
-                    "ttl": rr.get('TTL', SakuraCloudProvider.DEFAULT_TTL),
-                }
-            else:
-                rrset_map[key]["rdatas"].append(rr["RData"])
-
-        module: ModuleType = import_module("octodns.record")
-
-        for rrset in rrset_map.values():
-            _class_name: str = f'{rrset["type"].title()}Record'
-            cls: Record = getattr(module, _class_name)
-            values: list[str] = cls.parse_rdata_texts(rrset["rdatas"])
-            data: dict[str, Any] = {"type": rrset["type"], "ttl": rrset["ttl"]}
+        record_classes: dict[str, type[Record]] = self._record_classes()
+        default_ttl: int = SakuraCloudProvider.DEFAULT_TTL
+
+        # Sort supported records by (Name, Type) and stream the groups
+        # with groupby; each rrset's Record is built as its group closes,
+        # without an intermediate map of all rdatas.
+        group_key = itemgetter("Name", "Type")
+        rrs: list[dict[str, Any]] = [
+            rr
+            for rr in item["Settings"]["DNS"]["ResourceRecordSets"]
+            if rr["Type"] in self.SUPPORTS
+        ]
+        rrs.sort(key=group_key)
+
+        # Bind the hot callables to locals; on large zones the per-record
+        # attribute lookups add up.
+        new_record = Record.new
+        add_record = zone.add_record
+        debug_enabled: bool = self.log.isEnabledFor(DEBUG)
+
+        for (record_name, _type), group in groupby(rrs, key=group_key):
+            first: dict[str, Any] = next(group)
+            rdatas: list[str] = [first["RData"]]
+            rdatas.extend(rr["RData"] for rr in group)
+            if record_name == "@":
+                record_name = ""
+            cls: type[Record] = record_classes[_type]
+            values: list[str] = cls.parse_rdata_texts(rdatas)
+            data: dict[str, Any] = {
+                "type": _type,
+                "ttl": first.get('TTL', default_ttl),
+            }
             if len(values) == 1:
                 data["value"] = values[0]
             else:
                 data["values"] = values
-            self.log.debug(data)
-            record: Record = Record.new(
-                zone, rrset['name'], data, source=self, lenient=lenient
+            if debug_enabled:
+                self.log.debug(data)
+            record: Record = new_record(
+                zone, record_name, data, source=self, lenient=lenient
             )
-            zone.add_record(record, lenient=lenient)
+            add_record(record, lenient=lenient)
 
         self.log.info(
             'populate:   found %s records, exists=%s',
@@ -640,6 +826,32 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
         )
         return exists
 
+    def populate_many(
+        self, zones, target: bool = False, lenient: bool = False
+    ) -> list[bool]:
+        """Loads records for multiple zones with a single API request.
+
+        The commonserviceitem listing returns every zone in the account
+        in one response, so the first populate warms the cache for all
+        of them; the remaining zones are populated from the cached data
+        without further I/O.
+
+        :param zones: An iterable of dns zones.
+        :type  zones: collections.abc.Iterable
+        :param target: Passed through to populate().
+        :type  target: bool
+        :param lenient: Passed through to populate().
+        :type  lenient: bool
+        :return: The populate() result for each zone, in order.
+        :rtype: list
+        """
+        # A single listing request fills the map for every zone.
+        self.api.get_zone_names()
+        return [
+            self.populate(zone, target=target, lenient=lenient)
+            for zone in zones
+        ]
+
     def _apply(self, plan: Plan) -> None:
         """Submits actual planned changes to the provider. Returns the number of
         changes made.
@@ -656,31 +868,30 @@ class SakuraCloudProvider(BaseProvider):  # noqa: #501
             '_apply: zone=%s, len(changes)=%d', desired.name, len(changes)
         )
 
-        if desired.name not in self.list_zones():
+        if not self.api.has_zone(desired.name):
             self.api.create_zone(desired.name)
+            self._zone_names_sorted = None
+
+        default_ttl: int = SakuraCloudProvider.DEFAULT_TTL
 
         rrsets: list[dict[str, Any]] = []
+        rrsets_append = rrsets.append
         for record in desired.records:
-            record_name: str = record.name
-            if record.name == "":
-                record_name = "@"
+            record_name: str = record.name or "@"
             _, ttl, _type, values = record.rrs
             if _type == "TXT":
                 values = TxtValue.process(values)
+            xform: Callable[[str], str] | None = _VALUE_XFORMS.get(_type)
             for value in values:
-                if _type in ["TXT", "HTTPS", "SVCB"]:
-                    # Revert escaped semicolons in _ChunkedValue.
-                    value = value.replace('\\;', ';')
-                if _type == "CAA":
-                    v: dict[str, Any] = CaaValue.parse_rdata_text(value)
-                    value: str = f'{v["flags"]} {v["tag"]} "{v["value"]}"'
+                if xform is not None:
+                    value = xform(value)
                 rr: dict[str, str | int] = {
                     "Name": record_name,
                     "Type": _type,
                     "RData": value,
                 }
-                if ttl != SakuraCloudProvider.DEFAULT_TTL:
+                if ttl != default_ttl:
                     rr["TTL"] = ttl
-                rrsets.append(rr)
+                rrsets_append(rr)
 
         self.api.update_zone(desired.name, rrsets)
@@ -20,7 +20,13 @@ def version():
 
 description, long_description = descriptions()
 
-tests_require = ('pytest', 'pytest-cov', 'pytest-network')
+tests_require = (
+    'httpx[http2]>=0.27.0',
+    'orjson>=3.9.0',
+    'pytest',
+    'pytest-cov',
+    'pytest-network',
+)
 
 setup(
     author='Takashi Takizawa',
@@ -40,6 +46,12 @@ setup(
             'readme_renderer[md]>=26.0',
             'twine>=3.4.2',
         ),
+        # httpx provides the optional HTTP/2 transport enabled with
+        # http2=True; requests is used when it's not installed.
+        'http2': ('httpx[http2]>=0.27.0',),
+        # orjson speeds up API request/response (de)serialization; the
+        # stdlib json module is used when it's not installed.
+        'orjson': ('orjson>=3.9.0',),
         'test': tests_require,
     },
     install_requires=('octodns>=1.10.0', 'requests>=2.32.0'),
@@ -2,50 +2,42 @@
 #
 #
 
+import json
+from dataclasses import dataclass
+from functools import lru_cache
 from logging import getLogger
+from operator import itemgetter
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import httpx
+from requests import HTTPError, RequestException
 
 from octodns.provider.base import Plan
 from octodns.record import Create, Delete, Record, Update
 from octodns.zone import Zone
 
-from octodns_sakuracloud import (  # SakuraCloudException,
+from octodns_sakuracloud import (
     SakuraCloudAPI,
+    SakuraCloudException,
     SakuraCloudProvider,
     _add_trailing_dot,
     _remove_trailing_dot,
 )
 
-zone = Zone(name='unit.tests.', sub_zones=[])
-octo_records = []
-octo_records.append(
-    Record.new(
-        zone, '', {'ttl': 0, 'type': 'A', 'values': ['1.2.3.4', '10.10.10.10']}
-    )
-)
-octo_records.append(
-    Record.new(
-        zone, 'a', {'ttl': 1, 'type': 'A', 'values': ['1.2.3.4', '1.1.1.1']}
-    )
-)
-octo_records.append(
-    Record.new(zone, 'aa', {'ttl': 3600, 'type': 'A', 'values': ['1.2.4.3']})
-)
-octo_records.append(
-    Record.new(zone, 'aaa', {'ttl': 2, 'type': 'A', 'values': ['1.1.1.3']})
-)
-octo_records.append(
-    Record.new(
-        zone, 'cname', {'ttl': 3, 'type': 'CNAME', 'value': 'a.unit.tests.'}
-    )
-)
-octo_records.append(
-    Record.new(zone, '', {'ttl': 3, 'type': 'ALIAS', 'value': 'a.unit.tests.'})
-)
-octo_records.append(
-    Record.new(
-        zone,
+_LOG = getLogger('SakuraCloudProvider')
+
+
+# (name, data) pairs for the shared records; _octodns_fixtures turns
+# them into Records with a single Record.new call site.
+_RECORDS_SPEC = [
+    ('', {'ttl': 0, 'type': 'A', 'values': ['1.2.3.4', '10.10.10.10']}),
+    ('a', {'ttl': 1, 'type': 'A', 'values': ['1.2.3.4', '1.1.1.1']}),
+    ('aa', {'ttl': 3600, 'type': 'A', 'values': ['1.2.4.3']}),
+    ('aaa', {'ttl': 2, 'type': 'A', 'values': ['1.1.1.3']}),
+    ('cname', {'ttl': 3, 'type': 'CNAME', 'value': 'a.unit.tests.'}),
+    ('', {'ttl': 3, 'type': 'ALIAS', 'value': 'a.unit.tests.'}),
+    (
         'mx1',
         {
             'ttl': 3,
@@ -55,27 +47,17 @@ octo_records.append(
                 {'priority': 20, 'value': 'mx2.unit.tests.'},
             ],
         },
-    )
-)
-octo_records.append(
-    Record.new(
-        zone,
+    ),
+    (
         'mx2',
         {
             'ttl': 3,
             'type': 'MX',
             'values': [{'priority': 10, 'value': 'mx1.unit.tests.'}],
         },
-    )
-)
-octo_records.append(
-    Record.new(
-        zone, 'foo', {'ttl': 5, 'type': 'NS', 'value': 'ns1.unit.tests.'}
-    )
-)
-octo_records.append(
-    Record.new(
-        zone,
+    ),
+    ('foo', {'ttl': 5, 'type': 'NS', 'value': 'ns1.unit.tests.'}),
+    (
         '_srv._tcp',
         {
             'ttl': 6,
@@ -95,11 +77,8 @@ octo_records.append(
                 },
             ],
         },
-    )
-)
-octo_records.append(
-    Record.new(
-        zone,
+    ),
+    (
         '_srv2._tcp',
         {
             'ttl': 7,
@@ -113,38 +92,25 @@ octo_records.append(
                 }
             ],
         },
-    )
-)
-octo_records.append(
-    Record.new(
-        zone, 'txt1', {'ttl': 8, 'type': 'TXT', 'value': 'txt singleton test'}
-    )
-)
-octo_records.append(
-    Record.new(
-        zone,
+    ),
+    ('txt1', {'ttl': 8, 'type': 'TXT', 'value': 'txt singleton test'}),
+    (
         'txt2',
         {
             'ttl': 9,
             'type': 'TXT',
             'values': ['txt multiple test', 'txt multiple test 2'],
         },
-    )
-)
-octo_records.append(
-    Record.new(
-        zone,
+    ),
+    (
         'caa',
         {
             'ttl': 9,
             'type': 'CAA',
             'value': {'flags': 0, 'tag': 'issue', 'value': 'ca.unit.tests'},
         },
-    )
-)
-octo_records.append(
-    Record.new(
-        zone,
+    ),
+    (
         '_8443._https',
         {
             'ttl': 9,
@@ -155,11 +121,8 @@ octo_records.append(
                 'svcparams': {'alpn': ['h2']},
             },
         },
-    )
-)
-octo_records.append(
-    Record.new(
-        zone,
+    ),
+    (
         'www',
         {
             'ttl': 9,
@@ -170,69 +133,86 @@ octo_records.append(
                 'svcparams': {'alpn': ['h2']},
             },
         },
-    )
-)
-octo_records.append(
-    Record.new(
-        zone,
+    ),
+    (
         '',
         {
             'ttl': 9,
             'type': 'HTTPS',
             'value': {'svcpriority': 0, 'targetname': 'pool.unit.tests.'},
         },
-    )
-)
-for record in octo_records:
-    zone.add_record(record)
-
-# This is the format which the google API likes.
-resource_record_sets = [
-    {"Name": '@', "Type": 'A', "RData": '1.2.3.4', "TTL": 0},
-    {"Name": '@', "Type": 'A', "RData": '10.10.10.10', "TTL": 0},
-    {"Name": 'a', "Type": 'A', "RData": '1.1.1.1', "TTL": 1},
-    {"Name": 'a', "Type": 'A', "RData": '1.2.3.4', "TTL": 1},
-    {"Name": 'aa', "Type": 'A', "RData": '1.2.4.3', "TTL": 3600},
-    {"Name": 'aaa', "Type": 'A', "RData": '1.1.1.3', "TTL": 2},
-    {"Name": '@', "Type": 'ALIAS', "RData": 'a.unit.tests.', "TTL": 3},
-    {"Name": 'cname', "Type": 'CNAME', "RData": 'a.unit.tests.', "TTL": 3},
-    {"Name": 'mx1', "Type": 'MX', "RData": '10 mx1.unit.tests.', "TTL": 3},
-    {"Name": 'mx1', "Type": 'MX', "RData": '20 mx2.unit.tests.', "TTL": 3},
-    {"Name": 'mx2', "Type": 'MX', "RData": '10 mx1.unit.tests.', "TTL": 3},
-    {"Name": 'foo', "Type": 'NS', "RData": 'ns1.unit.tests.', "TTL": 5},
-    {
-        "Name": '_srv._tcp',
-        "Type": 'SRV',
-        "RData": '10 20 30 foo-1.unit.tests.',
-        "TTL": 6,
-    },
-    {
-        "Name": '_srv._tcp',
-        "Type": 'SRV',
-        "RData": '12 30 30 foo-2.unit.tests.',
-        "TTL": 6,
-    },
-    {
-        "Name": '_srv2._tcp',
-        "Type": 'SRV',
-        "RData": '12 17 1 srvfoo.unit.tests.',
-        "TTL": 7,
-    },
-    {"Name": 'txt1', "Type": 'TXT', "RData": 'txt singleton test', "TTL": 8},
-    {"Name": 'txt2', "Type": 'TXT', "RData": 'txt multiple test', "TTL": 9},
-    {"Name": 'txt2', "Type": 'TXT', "RData": 'txt multiple test 2', "TTL": 9},
-    {"Name": 'caa', "Type": 'CAA', "RData": '0 issue ca.unit.tests', "TTL": 9},
-    {"Name": '_8443._https', "Type": 'SVCB', "RData": '1 . alpn=h2', "TTL": 9},
-    {"Name": 'www', "Type": 'HTTPS', "RData": '1 . alpn=h2', "TTL": 9},
-    {"Name": '@', "Type": 'HTTPS', "RData": '0 pool.unit.tests.', "TTL": 9},
+    ),
 ]
 
-sakuracloud_zone = {
-    "Index": 0,
+
+@lru_cache(maxsize=1)
+def _octodns_fixtures():
+    """Builds the shared zone and records once, on first use."""
+    zone = Zone(name='unit.tests.', sub_zones=[])
+    octo_records = [
+        Record.new(zone, name, data) for name, data in _RECORDS_SPEC
+    ]
+    for record in octo_records:
+        zone.add_record(record)
+    return zone, tuple(octo_records)
+
+
+@lru_cache(maxsize=1)
+def _octodns_records_set():
+    """Returns the shared records as a frozenset, hashed once."""
+    return frozenset(_octodns_fixtures()[1])
+
+
+@dataclass(frozen=True)
+class RRSet:
+    """A ResourceRecordSet fixture entry, indexable like the API dicts."""
+
+    Name: str
+    Type: str
+    RData: str
+    TTL: int
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+# This is the format which the google API likes. Frozen so the fixtures
+# that embed it below share references instead of copies.
+resource_record_sets = (
+    RRSet('@', 'A', '1.2.3.4', 0),
+    RRSet('@', 'A', '10.10.10.10', 0),
+    RRSet('a', 'A', '1.1.1.1', 1),
+    RRSet('a', 'A', '1.2.3.4', 1),
+    RRSet('aa', 'A', '1.2.4.3', 3600),
+    RRSet('aaa', 'A', '1.1.1.3', 2),
+    RRSet('@', 'ALIAS', 'a.unit.tests.', 3),
+    RRSet('cname', 'CNAME', 'a.unit.tests.', 3),
+    RRSet('mx1', 'MX', '10 mx1.unit.tests.', 3),
+    RRSet('mx1', 'MX', '20 mx2.unit.tests.', 3),
+    RRSet('mx2', 'MX', '10 mx1.unit.tests.', 3),
+    RRSet('foo', 'NS', 'ns1.unit.tests.', 5),
+    RRSet('_srv._tcp', 'SRV', '10 20 30 foo-1.unit.tests.', 6),
+    RRSet('_srv._tcp', 'SRV', '12 30 30 foo-2.unit.tests.', 6),
+    RRSet('_srv2._tcp', 'SRV', '12 17 1 srvfoo.unit.tests.', 7),
+    RRSet('txt1', 'TXT', 'txt singleton test', 8),
+    RRSet('txt2', 'TXT', 'txt multiple test', 9),
+    RRSet('txt2', 'TXT', 'txt multiple test 2', 9),
+    RRSet('caa', 'CAA', '0 issue ca.unit.tests', 9),
+    RRSet('_8443._https', 'SVCB', '1 . alpn=h2', 9),
+    RRSet('www', 'HTTPS', '1 . alpn=h2', 9),
+    RRSet('@', 'HTTPS', '0 pool.unit.tests.', 9),
+)
+
+# Keys shared by every CommonServiceItem fixture below. The variants
+# only add an Index or swap the Settings payload, and the tests never
+# mutate them, so structural sharing of the nested dicts is safe.
+_ZONE_BASE = {
     "ID": "999999999999",
     "Name": "unit.tests",
     "Description": "",
-    "Settings": {"DNS": {"ResourceRecordSets": resource_record_sets}},
     "SettingsHash": "ffffffffffffffffffffffffffffffff",
     "Status": {
         "Zone": "unit.tests",
@@ -252,35 +232,18 @@ sakuracloud_zone = {
     "Tags": [],
 }
 
+sakuracloud_zone = {
+    **_ZONE_BASE,
+    "Index": 0,
+    "Settings": {"DNS": {"ResourceRecordSets": resource_record_sets}},
+}
+
 response_common_service_items = {
     "From": 0,
     "Count": 2,
     "Total": 2,
     "CommonServiceItems": [
-        {
-            "Index": 0,
-            "ID": "999999999999",
-            "Name": "unit.tests",
-            "Description": "",
-            "Settings": {"DNS": {"ResourceRecordSets": resource_record_sets}},
-            "SettingsHash": "ffffffffffffffffffffffffffffffff",
-            "Status": {
-                "Zone": "unit.tests",
-                "NS": ["ns1.gslbN.sakura.ne.jp", "ns2.gslbN.sakura.ne.jp"],
-            },
-            "ServiceClass": "cloud/dns",
-            "Availability": "available",
-            "CreatedAt": "2006-01-02T15:04:05+07:00",
-            "ModifiedAt": "2006-01-02T15:04:05+07:00",
-            "Provider": {
-                "ID": 9999999,
-                "Class": "dns",
-                "Name": "gslbN.sakura.ne.jp",
-                "ServiceClass": "cloud/dns",
-            },
-            "Icon": None,
-            "Tags": [],
-        },
+        sakuracloud_zone,
         {
             "Index": 1,
             "ID": "888888888888",
@@ -321,27 +284,8 @@ request_common_service_item_for_post = {
 
 response_common_service_item_for_post = {
     "CommonServiceItem": {
-        "ID": "999999999999",
-        "Name": "unit.tests",
-        "Description": "",
+        **_ZONE_BASE,
         "Settings": {"DNS": {"ResourceRecordSets": []}},
-        "SettingsHash": "ffffffffffffffffffffffffffffffff",
-        "Status": {
-            "Zone": "unit.tests",
-            "NS": ["ns1.gslbN.sakura.ne.jp", "ns2.gslbN.sakura.ne.jp"],
-        },
-        "ServiceClass": "cloud/dns",
-        "Availability": "available",
-        "CreatedAt": "2006-01-02T15:04:05+07:00",
-        "ModifiedAt": "2006-01-02T15:04:05+07:00",
-        "Provider": {
-            "ID": 9999999,
-            "Class": "dns",
-            "Name": "gslbN.sakura.ne.jp",
-            "ServiceClass": "cloud/dns",
-        },
-        "Icon": None,
-        "Tags": [],
     },
     "Success": True,
     "is_ok": True,
@@ -355,27 +299,8 @@ request_common_service_item_for_put = {
 
 response_common_service_item_for_put = {
     "CommonServiceItem": {
-        "ID": "999999999999",
-        "Name": "unit.tests",
-        "Description": "",
+        **_ZONE_BASE,
         "Settings": {"DNS": {"ResourceRecordSets": resource_record_sets}},
-        "SettingsHash": "ffffffffffffffffffffffffffffffff",
-        "Status": {
-            "Zone": "unit.tests",
-            "NS": ["ns1.gslbN.sakura.ne.jp", "ns2.gslbN.sakura.ne.jp"],
-        },
-        "ServiceClass": "cloud/dns",
-        "Availability": "available",
-        "CreatedAt": "2006-01-02T15:04:05+07:00",
-        "ModifiedAt": "2006-01-02T15:04:05+07:00",
-        "Provider": {
-            "ID": 9999999,
-            "Class": "dns",
-            "Name": "gslbN.sakura.ne.jp",
-            "ServiceClass": "cloud/dns",
-        },
-        "Icon": None,
-        "Tags": [],
     },
     "Success": True,
     "is_ok": True,
@@ -384,48 +309,56 @@ response_common_service_item_for_put = {
 
 class TestAddTrailingDot(TestCase):
     def test_add_trailing_dot(self):
-        for expected, test in [
-            ['tests.', 'tests'],
-            ['tests.', 'tests.'],
-            ['unit.tests.', 'unit.tests.'],
-            ['unit.tests.', 'unit.tests'],
-        ]:
-            self.assertEqual(expected, _add_trailing_dot(test))
+        self.assertEqual(
+            ['tests.', 'tests.', 'unit.tests.', 'unit.tests.'],
+            [
+                _add_trailing_dot(arg)
+                for arg in ('tests', 'tests.', 'unit.tests.', 'unit.tests')
+            ],
+        )
 
 
 class TestRemoveTrailingDot(TestCase):
 
     def test_remove_trailing_dot(self):
-        for expected, arg in [
-            ['tests', 'tests'],
-            ['tests', 'tests.'],
-            ['unit.tests', 'unit.tests.'],
-            ['unit.tests', 'unit.tests'],
-        ]:
-            self.assertEqual(expected, _remove_trailing_dot(arg))
+        self.assertEqual(
+            ['tests', 'tests', 'unit.tests', 'unit.tests'],
+            [
+                _remove_trailing_dot(arg)
+                for arg in ('tests', 'tests.', 'unit.tests.', 'unit.tests')
+            ],
+        )
 
 
+@patch.object(SakuraCloudAPI, '_request')
 class TestSakuraCloudAPI(TestCase):
+    # The class-level patch resolves SakuraCloudAPI._request once and
+    # injects the mock into every test method.
 
     def _get_api(self):
-        log = getLogger('SakuraCloudProvider')
-        return SakuraCloudAPI("", "", "http://localhost", 1, log)
+        return SakuraCloudAPI("", "", "http://localhost", 1, _LOG)
 
-    @patch('octodns_sakuracloud.SakuraCloudAPI._request')
     def test_get_zone(self, mock_request):
         api = self._get_api()
 
         mock_request.return_value = response_common_service_items
-        self.assertDictEqual(sakuracloud_zone, api.get_zone("unit.tests."))
+        # The listing fixture embeds sakuracloud_zone itself, so the map
+        # hands back the very same object; an identity check is enough.
+        self.assertIs(sakuracloud_zone, api.get_zone("unit.tests."))
+
+    def test_has_zone(self, mock_request):
+        api = self._get_api()
+
+        mock_request.return_value = response_common_service_items
+        self.assertTrue(api.has_zone("unit.tests."))
+        self.assertFalse(api.has_zone("other.tests."))
 
-    @patch('octodns_sakuracloud.SakuraCloudAPI._request')
     def test_get_zone_names(self, mock_request):
         api = self._get_api()
 
         mock_request.return_value = response_common_service_items
-        self.assertListEqual(["unit.tests."], api.get_zone_names())
+        self.assertEqual(["unit.tests."], list(api.get_zone_names()))
 
-    @patch('octodns_sakuracloud.SakuraCloudAPI._request')
     def test_create_zone(self, mock_request):
         api = self._get_api()
 
@@ -442,7 +375,6 @@ class TestSakuraCloudAPI(TestCase):
                     request_common_service_item_for_post, c.kwargs["json"]
                 )
 
-    @patch('octodns_sakuracloud.SakuraCloudAPI._request')
     def test_update_zone(self, mock_request):
         api = self._get_api()
 
@@ -463,8 +395,161 @@ class TestSakuraCloudAPI(TestCase):
                 )
 
 
+# Response body of an error response; see SakuraCloudAPI._request.
+error_response_content = (
+    b'{"is_fatal": true,'
+    b' "serial": "ffffffffffffffffffffffffffffffff",'
+    b' "status": "401 Unauthorized",'
+    b' "error_code": "unauthorized",'
+    b' "error_msg": "error-unauthorized"}'
+)
+
+
+class TestSakuraCloudAPIRequest(TestCase):
+    # _request is exercised directly here; TestSakuraCloudAPI patches it
+    # away at the class level.
+
+    def _get_api(self):
+        return SakuraCloudAPI("", "", "http://localhost", 1, _LOG)
+
+    def _get_response(self, content=b'{"Count": 0}'):
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.content = content
+        return resp
+
+    def test_request(self):
+        api = self._get_api()
+
+        with patch.object(api._session, 'request') as mock_request:
+            mock_request.return_value = self._get_response()
+            self.assertEqual(
+                {"Count": 0}, api._request("GET", "/commonserviceitem")
+            )
+
+        c = mock_request.call_args
+        self.assertEqual("http://localhost/commonserviceitem", c.kwargs["url"])
+        self.assertIsNone(c.kwargs["data"])
+
+    def test_request_json_body(self):
+        api = self._get_api()
+
+        with patch.object(api._session, 'request') as mock_request:
+            mock_request.return_value = self._get_response()
+            api._request("POST", "/commonserviceitem", json={"Count": 0})
+
+        data = mock_request.call_args.kwargs["data"]
+        self.assertEqual({"Count": 0}, json.loads(data))
+
+    def test_request_stream(self):
+        api = self._get_api()
+
+        resp = self._get_response()
+        resp.raw.read.return_value = b'{"Count": 0}'
+        with patch.object(api._session, 'request') as mock_request:
+            mock_request.return_value = resp
+            self.assertEqual(
+                {"Count": 0},
+                api._request("GET", "/commonserviceitem", stream=True),
+            )
+
+        resp.raw.read.assert_called_once_with(decode_content=True)
+        resp.close.assert_called_once()
+
+    def test_request_request_error(self):
+        api = self._get_api()
+
+        with patch.object(api._session, 'request') as mock_request:
+            mock_request.side_effect = RequestException("connection refused")
+            with self.assertRaises(SakuraCloudException) as ctx:
+                api._request("GET", "/commonserviceitem")
+
+        self.assertIn("Request error", str(ctx.exception))
+
+    def test_request_http_error(self):
+        api = self._get_api()
+
+        resp = self._get_response(error_response_content)
+        resp.status_code = 401
+        resp.raise_for_status.side_effect = HTTPError(response=resp)
+        with patch.object(api._session, 'request') as mock_request:
+            mock_request.return_value = resp
+            with self.assertRaises(SakuraCloudException) as ctx:
+                api._request("GET", "/commonserviceitem")
+
+        self.assertIn("error_code=unauthorized", str(ctx.exception))
+        resp.close.assert_called_once()
+
+
+class TestSakuraCloudAPIHTTP2(TestCase):
+
+    def _get_api(self):
+        api = SakuraCloudAPI("", "", "http://localhost", 1, _LOG, http2=True)
+        api._client.close()
+        api._client = MagicMock()
+        return api
+
+    def _get_response(self, content=b'{"Count": 0}'):
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.content = content
+        return resp
+
+    def test_http2_requires_httpx(self):
+        with patch('octodns_sakuracloud._httpx', None):
+            with self.assertRaises(SakuraCloudException) as ctx:
+                SakuraCloudAPI("", "", "http://localhost", 1, _LOG, http2=True)
+
+        self.assertIn("httpx", str(ctx.exception))
+
+    def test_http2_client(self):
+        api = SakuraCloudAPI("", "", "http://localhost", 1, _LOG, http2=True)
+        self.assertIsInstance(api._client, httpx.Client)
+        # __del__ closes the HTTP/2 client along with the session.
+        del api
+
+    def test_request_http2(self):
+        api = self._get_api()
+
+        api._client.request.return_value = self._get_response()
+        self.assertEqual(
+            {"Count": 0}, api._request("GET", "/commonserviceitem")
+        )
+        api._client.request.assert_called_once_with(
+            "GET", "http://localhost/commonserviceitem", content=None
+        )
+
+    def test_request_http2_request_error(self):
+        api = self._get_api()
+
+        api._client.request.side_effect = httpx.HTTPError("connection refused")
+        with self.assertRaises(SakuraCloudException) as ctx:
+            api._request("GET", "/commonserviceitem")
+
+        self.assertIn("Request error", str(ctx.exception))
+
+    def test_request_http2_http_error(self):
+        api = self._get_api()
+
+        resp = self._get_response(error_response_content)
+        resp.status_code = 401
+        resp.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "401 Unauthorized", request=MagicMock(), response=resp
+        )
+        api._client.request.return_value = resp
+        with self.assertRaises(SakuraCloudException) as ctx:
+            api._request("GET", "/commonserviceitem")
+
+        self.assertIn("error_code=unauthorized", str(ctx.exception))
+
+
 class TestSakuraCloudProvider(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.zone, cls.octo_records = _octodns_fixtures()
+        cls.octo_records_set = _octodns_records_set()
+
     def _get_provider(self):
         return SakuraCloudProvider(
             1, "", "", endpoint="http://localhost/", timeout=60
@@ -472,8 +557,6 @@ class TestSakuraCloudProvider(TestCase):
 
     @patch.object(SakuraCloudAPI, 'get_zone_names')
     def test_list_zones(self, mock_get_zone_names):
-        provider = self._get_provider()
-
         for expected, arg in [
             [[], []],
             [["unit.tests."], ["unit.tests."]],
@@ -482,8 +565,18 @@ class TestSakuraCloudProvider(TestCase):
                 ["b.unit.tests.", "a.unit.tests."],
             ],
         ]:
+            provider = self._get_provider()
             mock_get_zone_names.return_value = arg
-            self.assertListEqual(expected, provider.list_zones())
+            self.assertEqual(expected, provider.list_zones())
+
+    @patch.object(SakuraCloudAPI, 'get_zone_names')
+    def test_list_zones_cached(self, mock_get_zone_names):
+        provider = self._get_provider()
+
+        mock_get_zone_names.return_value = ["unit.tests."]
+        self.assertEqual(["unit.tests."], provider.list_zones())
+        self.assertEqual(["unit.tests."], provider.list_zones())
+        mock_get_zone_names.assert_called_once()
 
     @patch.object(SakuraCloudAPI, 'get_zone')
     def test_populate(self, mock_get_zone):
@@ -492,19 +585,32 @@ class TestSakuraCloudProvider(TestCase):
         mock_get_zone.return_value = sakuracloud_zone
         actual_zone = Zone('unit.tests.', [])
         provider.populate(actual_zone)
-        self.assertSetEqual(set(octo_records), actual_zone.records)
+        self.assertEqual(self.octo_records_set, actual_zone.records)
 
         mock_get_zone.return_value = None
         actual_zone = Zone('unit.tests.', [])
         self.assertFalse(provider.populate(actual_zone))
 
+    @patch('octodns_sakuracloud.SakuraCloudAPI._request')
+    def test_populate_many(self, mock_request):
+        provider = self._get_provider()
+
+        mock_request.return_value = response_common_service_items
+        actual_zone = Zone('unit.tests.', [])
+        missing_zone = Zone('missing.tests.', [])
+        self.assertEqual(
+            [True, False], provider.populate_many([actual_zone, missing_zone])
+        )
+        self.assertEqual(self.octo_records_set, actual_zone.records)
+        mock_request.assert_called_once()
+
     @patch('octodns_sakuracloud.SakuraCloudAPI')
     def test_apply(self, mock_api):
         provider = self._get_provider()
 
         self.maxDiff = True
 
-        mock_api.get_zone_names.return_value = ['unit.tests.']
+        mock_api.return_value.has_zone.return_value = True
 
         apply_z = Zone("unit.tests.", [])
         create_r = Record.new(
@@ -523,6 +629,12 @@ class TestSakuraCloudProvider(TestCase):
         update_new_r = Record.new(
             apply_z, 'aa', {'ttl': 666, 'type': 'A', 'values': ['1.4.3.2']}
         )
+        # The escaped semicolon must be reverted on apply.
+        txt_r = Record.new(
+            apply_z,
+            'txt',
+            {'ttl': 3, 'type': 'TXT', 'value': 'v=spf1 -all\\; note'},
+        )
 
         existing = Zone('unit.tests.', [])
         existing.add_record(update_existing_r)
@@ -531,9 +643,11 @@ class TestSakuraCloudProvider(TestCase):
         desired = Zone('unit.tests.', [])
         desired.add_record(create_r)
         desired.add_record(update_new_r)
+        desired.add_record(txt_r)
 
         changes = []
         changes.append(Create(create_r))
+        changes.append(Create(txt_r))
         changes.append(Delete(delete_r))
         changes.append(Update(existing=update_existing_r, new=update_new_r))
 
@@ -547,24 +661,26 @@ class TestSakuraCloudProvider(TestCase):
             {'Name': '@', 'Type': 'A', 'RData': '1.2.3.4', 'TTL': 0},
             {'Name': '@', 'Type': 'A', 'RData': '10.10.10.10', 'TTL': 0},
             {'Name': 'aa', 'Type': 'A', 'RData': '1.4.3.2', 'TTL': 666},
+            {
+                'Name': 'txt',
+                'Type': 'TXT',
+                'RData': 'v=spf1 -all; note',
+                'TTL': 3,
+            },
         ]
 
-        for c in mock_api.mock_calls:
-            if str(c).startswith('call().update_zone('):
-                self.assertEqual("unit.tests.", c.args[0])
-                actual = sorted(
-                    c.args[1],
-                    key=lambda x: ':'.join([x['Name'], x['Type'], x['RData']]),
-                )
-                self.assertEqual(rrsets, actual)
+        for c in mock_api.return_value.update_zone.call_args_list:
+            self.assertEqual("unit.tests.", c.args[0])
+            actual = sorted(c.args[1], key=itemgetter('Name', 'Type', 'RData'))
+            self.assertEqual(rrsets, actual)
 
         # create zone
-        mock_api.get_zone_names.return_value = []
+        mock_api.return_value.has_zone.return_value = False
 
         apply_z = Zone("unit.tests.", [])
 
         desired = Zone('unit.tests.', [])
-        for r in octo_records:
+        for r in self.octo_records:
             desired.add_record(r)
 
         existing = None
@@ -578,14 +694,12 @@ class TestSakuraCloudProvider(TestCase):
             )
         )
 
-        for c in mock_api.mock_calls:
-            if str(c).startswith('call().create_zone'):
-                self.assertEqual("unit.tests.", c.args[0])
-
-            # if str(c).startswith('call().update_zone('):
-            #     self.assertEqual("unit.tests.", c.args[0])
-            #     actual = sorted(
-            #         c.args[1],
-            #         key=lambda x: ':'.join([x['Name'], x['Type'], x['RData']]),
-            #     )
-            #     self.assertEqual(rrsets, actual)
+        for c in mock_api.return_value.create_zone.call_args_list:
+            self.assertEqual("unit.tests.", c.args[0])
+
+        # for c in mock_api.return_value.update_zone.call_args_list:
+        #     self.assertEqual("unit.tests.", c.args[0])
+        #     actual = sorted(
+        #         c.args[1], key=itemgetter('Name', 'Type', 'RData')
+        #     )
+        #     self.assertEqual(rrsets, actual)